@@ -15,54 +15,120 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import re
 
-RE_TEL = re.compile(r"[\u0C00-\u0C7F]")   # Telugu
-RE_DEV = re.compile(r"[\u0900-\u097F]")   # Devanagari (Sanskrit/Hindi)
-RE_LAT = re.compile(r"[A-Za-z]")          # English (ASCII letters)
+# str.translate table mapping each codepoint to its class letter:
+#   "t" = Telugu, "e" = English (ASCII letters), "s" = Devanagari (Sanskrit/Hindi)
+# Everything else maps to None (dropped). Codepoints past the end of the table
+# are left untouched; none of them can be a class letter.
+LANG_TABLE: List[Optional[str]] = [None] * 0x0C80
+for _c in range(0x0C00, 0x0C80):
+    LANG_TABLE[_c] = "t"
+for _c in range(0x0900, 0x0980):
+    LANG_TABLE[_c] = "s"
+for _c in (*range(0x41, 0x5B), *range(0x61, 0x7B)):
+    LANG_TABLE[_c] = "e"
+del _c
+
 SEP_LINE = re.compile(r"^\s*-{3,}\s*$")   # lines of only dashes
-BLANK = re.compile(r"^\s*$")
+MULTI_BLANK = re.compile(r"\n{3,}")       # runs of 3+ newlines
 
 def detect_language(line: str) -> Optional[str]:
-    if RE_TEL.search(line):
+    classes = line.translate(LANG_TABLE)  # one C-level pass over the line
+    if "t" in classes:
         return "te"
-    if RE_LAT.search(line):               # English takes precedence over Sanskrit
+    if "e" in classes:                    # English takes precedence over Sanskrit
         return "en"
-    if RE_DEV.search(line):
+    if "s" in classes:
         return "sa"
     return None
 
+CLASS_LANG = (None, "te", "en", "sa")  # codes written by the Numba classifier
+
+def _classify_codepoints(cps, line_ends, out):
+    """
+    Same rules as detect_language over a UTF-32 codepoint array; line i spans
+    [previous end + 1, line_ends[i]). Writes one CLASS_LANG code per line to out.
+    """
+    start = 0
+    for i in range(line_ends.shape[0]):
+        end = line_ends[i]
+        lat = False
+        dev = False
+        code = 0
+        for j in range(start, end):
+            c = cps[j]
+            if 0x0C00 <= c <= 0x0C7F:
+                code = 1
+                break
+            if (0x41 <= c <= 0x5A) or (0x61 <= c <= 0x7A):
+                lat = True
+            elif 0x0900 <= c <= 0x097F:
+                dev = True
+        if code == 0:
+            code = 2 if lat else (3 if dev else 0)
+        out[i] = code
+        start = end + 1
+
+# (numpy, jitted _classify_codepoints) once loaded; False if numba is unavailable.
+# Imported on first use so runs that parse nothing don't pay for numba.
+_NUMBA = None
+
+def _numba_classifier():
+    global _NUMBA
+    if _NUMBA is None:
+        try:  # optional: JIT-compiled line classifier (falls back to str.translate)
+            import numpy as np
+            from numba import njit
+        except ImportError:
+            _NUMBA = False
+        else:
+            _NUMBA = (np, njit(cache=True)(_classify_codepoints))
+    return _NUMBA
+
+def classify_lines(lines: List[str]) -> List[Optional[str]]:
+    """Detect the language of every line of a file (Numba fast path if installed)."""
+    numba_impl = _numba_classifier() if lines else False
+    if not numba_impl:
+        return [detect_language(line) for line in lines]
+    np, classify = numba_impl
+    text = "\n".join(lines)
+    cps = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    line_ends = np.cumsum(np.array([len(line) + 1 for line in lines], dtype=np.int64)) - 1
+    out = np.zeros(len(lines), dtype=np.uint8)
+    classify(cps, line_ends, out)
+    return [CLASS_LANG[c] for c in out.tolist()]
+
 def parse_file(path: Path) -> Dict:
-    text = path.read_text(encoding="utf-8").replace("\r\n", "\n")
+    # Decode once and split on \r\n, \r and \n only. Not str.splitlines(): it also
+    # breaks on \v, \f, \x1c-\x1e, \x85, U+2028/U+2029 (e.g. Word manual line
+    # breaks), which would move text between buckets.
+    text = path.read_bytes().decode("utf-8")
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
     sa: List[str] = []
     te: List[str] = []
     en: List[str] = []
+    buckets: Dict[str, List[str]] = {"sa": sa, "te": te, "en": en}
     current: Optional[str] = None  # last chosen bucket
 
-    def put(bucket: str, line: str):
-        if bucket == "sa": sa.append(line)
-        elif bucket == "te": te.append(line)
-        else: en.append(line)
+    langs = classify_lines(lines)
 
-    for raw in text.split("\n"):
+    for raw, lang in zip(lines, langs):
         line = raw.rstrip()
 
-        if SEP_LINE.match(line):
-            if current:
-                put(current, "")          # paragraph break in the active bucket
-            continue
-
-        if BLANK.match(line):
+        # Blank (empty after rstrip) or separator line: paragraph break in the
+        # active bucket. The substring test keeps the regex off ordinary lines.
+        if not line or ("---" in line and SEP_LINE.match(line)):
             if current:
-                put(current, "")
+                buckets[current].append("")
             continue
 
-        bucket = detect_language(line) or current or "sa"
-        put(bucket, line)
+        bucket = lang or current or "sa"
+        buckets[bucket].append(line)
         current = bucket
 
     def join_clean(parts: List[str]) -> str:
         s = "\n".join(parts).strip()
         # collapse 3+ blank lines to 2 to avoid excessive spacing
-        return re.sub(r"\n{3,}", "\n\n", s)
+        return MULTI_BLANK.sub("\n\n", s)
 
     return {
         "sa": join_clean(sa),
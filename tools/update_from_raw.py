@@ -6,10 +6,15 @@ update_from_raw.py — Build/refresh the vv-data "DB" from raw_data.
 What this does
 --------------
 - Reads settings from tools/config.env (no hardcoded paths).
-- Detects changed raw files (by SHA256) and parses only those.
+- Detects changed raw files (by content hash) and parses only those. Files whose
+  mtime+size match the local, untracked vv/state/.<state>.stat_cache.json are not
+  re-hashed (--paranoid to force).
+  Uses xxh3 when the xxhash package is installed, else SHA256
+  (--cryptographic-hash always uses SHA256).
 - Optional: reprocess ALL files with --force-all (useful after parser changes).
 - Writes verse JSON to vv/data/<source>/<collection>/verse-XXX.json.
-- Rebuilds vv/data/.../index.json (count + file list).
+- Updates vv/data/.../index.json (count + file list) and search-index.json in
+  place; full rescan of the data dir on --force-all or if they drifted.
 - Updates vv/manifests/<MANIFEST_NAME> with { base, total, last_updated }.
 - Tracks processed raw files in vv/state/raw_index.json.
 - Optional: writes Cloudflare Pages _headers (CORS + no-store).
@@ -20,6 +25,8 @@ Run (from repo root: veda-vedanta-data)
     python3 tools/update_from_raw.py --dry-run
     python3 tools/update_from_raw.py
     python3 tools/update_from_raw.py --force-all
+    python3 tools/update_from_raw.py --paranoid
+    python3 tools/update_from_raw.py --cryptographic-hash
     python3 tools/update_from_raw.py --config tools/alt.env --push
 
 Config precedence (highest -> lowest)
@@ -31,14 +38,35 @@ Config precedence (highest -> lowest)
 
 import argparse
 import hashlib
+import importlib
 import importlib.util
 import json
+import keyword
+import mmap
 import os
 import re
 import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Tuple, Optional, List
+from types import ModuleType
+from typing import Dict, Any, Tuple, Optional, List, Union
+
+try:  # optional: orjson serializes in C and emits UTF-8 bytes directly
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: fast non-cryptographic hash for change detection
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:  # optional: libgit2 bindings for in-process git add/commit
+    import pygit2
+except ImportError:
+    pygit2 = None
 
 # ---------------------------- Config helpers ----------------------------
 
@@ -101,39 +129,252 @@ def load_config(repo_root: Path, explicit: Optional[Path]) -> Dict[str, Any]:
 # This regex now matches "verse-001.txt" and "name-052.txt"
 # and the future "epilogue-001.txt"
 VERSE_RE = re.compile(r"(verse|name|epilogue)-(\d+)\.(txt|md|json)$", re.IGNORECASE)
+# Output JSON prefixes (always lowercase, see out_name in main)
+OUTPUT_PREFIXES = ("verse-", "name-", "epilogue-")
 
 def sha256_file(p: Path) -> str:
-    h = hashlib.sha256()
+    """Hash the whole file in C (file_digest on 3.11+, else one call over an mmap)."""
     with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        if os.fstat(f.fileno()).st_size == 0:  # mmap cannot map empty files
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+def dump_json(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes (2-space indent, non-ASCII kept as-is)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """Write via a sibling temp file + os.replace, so readers never see a partial file."""
+    tmp = os.fspath(path) + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        # Never leave a stray *.tmp in vv/data for the git add step to pick up
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+def same_bytes(path: Union[str, Path], data: bytes) -> bool:
+    """True if path already holds exactly these bytes."""
+    try:
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+def unchanged_stamp(path: Union[str, Path], obj: Dict[str, Any]) -> Optional[str]:
+    """
+    last_modified of the existing verse JSON at path if it equals obj apart from
+    that stamp (obj must not carry one yet); None if missing, unreadable or different.
+    """
+    try:
+        with open(path, "rb") as f:
+            prev = json.loads(f.read())
+        stamp = prev["metadata"].pop("last_modified", None)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return stamp if prev == obj else None
+
+def xxh3_file(p: Path) -> str:
+    """xxh3-64 of the file; change detection only, not security-sensitive."""
+    return xxhash.xxh3_64(p.read_bytes()).hexdigest()
 
 def load_state(state_path: Path) -> Dict[str, Any]:
     if state_path.exists():
         return json.loads(state_path.read_text(encoding="utf-8"))
     return {"last_parsed_commit": "", "files": {}}
 
+def load_stat_cache(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Local, untracked {rel: {mtime_ns, size, <hash field>}} cache for the stat
+    shortcut. Mtimes are per checkout, so this must never go into the state file.
+    """
+    try:
+        return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
 def save_state(state_path: Path, state: Dict[str, Any]) -> None:
     state_path.parent.mkdir(parents=True, exist_ok=True)
-    state_path.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+    atomic_write_bytes(state_path, dump_json(state))
+
+# Loaded adapters as path -> (mtime_ns at last (re)import, module). An edited
+# adapter is reloaded, an unchanged one reused by long-running/watch-mode callers.
+_PARSER_CACHE: Dict[str, Tuple[int, ModuleType]] = {}
 
-def load_parser(parser_path: Path):
-    """Dynamically load the adapter module which must expose parse_file(Path)->dict."""
+def _same_file(path: Optional[str], parser_path: Path) -> bool:
+    return bool(path) and Path(path).resolve() == parser_path.resolve()
+
+def _importable_by_name(parser_path: Path) -> bool:
+    """
+    True if the adapter can be imported under its own stem without clashing:
+    the stem is a valid module name and neither sys.modules nor sys.path has a
+    different module by that name (e.g. an adapter called json.py or csv.py).
+    """
+    stem = parser_path.stem
+    if not stem.isidentifier() or keyword.iskeyword(stem):
+        return False
+    if stem in sys.modules:
+        return _same_file(getattr(sys.modules[stem], "__file__", None), parser_path)
+    try:
+        spec = importlib.util.find_spec(stem)
+    except (ImportError, ValueError):
+        return False
+    return spec is None or _same_file(spec.origin, parser_path)
+
+def _import_adapter(parser_path: Path, previous: Optional[ModuleType]) -> ModuleType:
+    """Import (or reload) the adapter by name, with its directory on sys.path only meanwhile."""
+    parser_dir = str(parser_path.parent)
+    sys.path.insert(0, parser_dir)
+    try:
+        importlib.invalidate_caches()
+        if previous is not None and sys.modules.get(previous.__name__) is previous:
+            return importlib.reload(previous)
+        return importlib.import_module(parser_path.stem)
+    except ImportError as e:
+        raise SystemExit(f"Cannot import parser from: {parser_path} ({e})")
+    finally:
+        sys.path.remove(parser_dir)
+
+def _exec_adapter(parser_path: Path) -> ModuleType:
+    """
+    Load the adapter straight from its file under the private name vv_parser
+    (names like "mvr-vishnu.adapter.py", or stems that clash with other modules).
+    """
     spec = importlib.util.spec_from_file_location("vv_parser", str(parser_path))
     if spec is None or spec.loader is None:
         raise SystemExit(f"Cannot import parser from: {parser_path}")
     mod = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(mod)  # type: ignore
+    return mod
+
+def load_parser(parser_path: Path) -> ModuleType:
+    """Import the adapter module which must expose parse_file(Path)->dict."""
+    key = str(parser_path)
+    mtime = parser_path.stat().st_mtime_ns
+    cached = _PARSER_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    mod = None
+    if _importable_by_name(parser_path):
+        # Regular import: cached in sys.modules, no re-exec on later calls
+        mod = _import_adapter(parser_path, cached[1] if cached else None)
+        if not _same_file(getattr(mod, "__file__", None), parser_path):
+            mod = None
+    if mod is None:
+        mod = _exec_adapter(parser_path)
     if not hasattr(mod, "parse_file") or not callable(mod.parse_file):
         raise SystemExit("Parser module must expose parse_file(Path)->dict")
+    _PARSER_CACHE[key] = (mtime, mod)
     return mod
 
+# Parser handle for ProcessPoolExecutor workers (set once per worker process).
+_WORKER_PARSER = None
+
+def _init_parser_worker(parser_path: Path) -> None:
+    global _WORKER_PARSER
+    _WORKER_PARSER = load_parser(parser_path)
+
+def _parse_in_worker(src: Path) -> Dict[str, Any]:
+    return _WORKER_PARSER.parse_file(src)
+
+def pool_map(fn, items: List[Any], jobs: int, **pool_kw) -> List[Any]:
+    """Order-preserving map over a process pool; runs inline for jobs <= 1 or a single item."""
+    if jobs <= 1 or len(items) <= 1:
+        return [fn(x) for x in items]
+    with ProcessPoolExecutor(max_workers=jobs, **pool_kw) as ex:
+        return list(ex.map(fn, items, chunksize=8))
+
 def validate_minimal(obj: Dict[str, Any], verse_id: str) -> None:
     missing = [k for k in ("sa", "te", "en") if k not in obj]
     if missing:
         raise ValueError(f"{verse_id}: missing keys {missing}")
 
+# ---------------------------- Index helpers ----------------------------
+
+SEARCH_INDEX_NAME = "search-index.json"
+
+def index_item(name: str, item_type: str, item_num: int) -> Dict[str, Any]:
+    item = {"file": name, "type": item_type, "id": item_num}
+    # For backwards compatibility with the UI, ensure 'verse' or 'nama' key exists.
+    if item_type == "verse":
+        item["verse"] = item_num
+    elif item_type == "name":
+        item["nama"] = item_num
+    elif item_type == "epilogue":
+        item["epilogue"] = item_num
+    return item
+
+def search_entry(item_type: str, item_num: int, content: Dict[str, Any]) -> Dict[str, Any]:
+    search_text = content.get("sa", "").split('\n')[0] # First line of Sanskrit
+    full_content = ' '.join(str(v) for v in content.values() if isinstance(v, str))
+    return {
+        "id": item_num,
+        "type": item_type,
+        "text": search_text,
+        "content": full_content
+    }
+
+IndexEntries = Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]  # file -> (index item, search entry)
+
+def list_output_names(data_dir: Path) -> Dict[str, Tuple[str, int]]:
+    """Output JSON files in data_dir as {file: (type, number)}; names only, no reads."""
+    names: Dict[str, Tuple[str, int]] = {}
+    # Look for verse-*.json, name-*.json and epilogue-*.json. These are written
+    # by main() as "<prefix>-<NNN>.json", so plain string checks are enough.
+    for e in os.scandir(data_dir):
+        name = e.name
+        if not (name.startswith(OUTPUT_PREFIXES) and name.endswith(".json") and e.is_file()):
+            continue
+        item_type, _, num_str = name[:-5].partition("-") # "verse", "name", or "epilogue"
+        if num_str.isdecimal():  # not isdigit(): that accepts e.g. "²", which int() rejects
+            names[name] = (item_type, int(num_str))
+    return names
+
+def scan_index_entries(data_dir: Path, names: Dict[str, Tuple[str, int]]) -> IndexEntries:
+    """Full rebuild: read every output JSON listed in names."""
+    entries: IndexEntries = {}
+    for name, (item_type, item_num) in names.items():
+        content = json.loads((data_dir / name).read_bytes())
+        entries[name] = (index_item(name, item_type, item_num), search_entry(item_type, item_num, content))
+    return entries
+
+def index_digest(index_bytes: bytes, search_bytes: bytes) -> str:
+    return hashlib.sha256(index_bytes + search_bytes).hexdigest()
+
+def load_index_entries(index_path: Path, search_path: Path, expected_digest: Optional[str]) -> Optional[IndexEntries]:
+    """
+    Previous index + search index as entries, or None when they are missing,
+    unreadable, or no longer match the digest recorded in state (edited by hand).
+    """
+    if not expected_digest:
+        return None
+    try:
+        index_bytes = index_path.read_bytes()
+        search_bytes = search_path.read_bytes()
+        if index_digest(index_bytes, search_bytes) != expected_digest:
+            return None
+        sections = json.loads(index_bytes)["sections"]
+        by_key = {(e["type"], e["id"]): e for e in json.loads(search_bytes)}
+        return {
+            item["file"]: (item, by_key[(item["type"], item["id"])])
+            for sec in sections.values() for item in sec["items"]
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
 def ensure_headers(path: Path, write: bool) -> None:
     """Write Cloudflare Pages headers to allow CORS and disable caching (if enabled)."""
     if not write:
@@ -148,7 +389,57 @@ def ensure_headers(path: Path, write: bool) -> None:
     )
     current = path.read_text(encoding="utf-8") if path.exists() else ""
     if current != content:
-        path.write_text(content, encoding="utf-8")
+        atomic_write_bytes(path, content.encode("utf-8"))
+
+GIT_PATHS = ["vv/data", "vv/manifests", "vv/state/raw_index.json"]
+GIT_COMMIT_MSG = "Parsed updates from raw"
+
+COMMIT_HOOKS = ("pre-commit", "prepare-commit-msg", "commit-msg", "post-commit")
+
+def _pygit2_can_commit(repo: "pygit2.Repository") -> bool:
+    """
+    libgit2 neither runs hooks nor signs commits, so leave the commit to the git
+    CLI when the repo has commit hooks installed or commit.gpgsign set.
+    """
+    cfg = repo.config
+    if "commit.gpgsign" in cfg and cfg.get_bool("commit.gpgsign"):
+        return False
+    if "core.hooksPath" in cfg:
+        hooks = Path(os.path.expanduser(cfg["core.hooksPath"]))
+        if not hooks.is_absolute():
+            hooks = Path(repo.workdir) / hooks
+    else:
+        hooks = Path(repo.path) / "hooks"
+    return not any(os.access(hooks / h, os.X_OK) for h in COMMIT_HOOKS)
+
+def _git_commit_pygit2(repo_root: Path) -> Optional[bool]:
+    """
+    Stage + commit in-process via libgit2. Returns False if the tree is unchanged,
+    None if the commit must go through the git CLI instead (hooks/signing).
+    """
+    repo = pygit2.Repository(str(repo_root))
+    if not _pygit2_can_commit(repo):
+        return None
+    index = repo.index
+    # Like `git add <dir>`: add new/modified files (tracked files are updated even
+    # if they match .gitignore), then stage deletions of tracked files under GIT_PATHS.
+    index.add_all(GIT_PATHS)
+    workdir = Path(repo.workdir)
+    gone = [
+        e.path for e in index
+        if any(e.path == p or e.path.startswith(p + "/") for p in GIT_PATHS)
+        and not os.path.lexists(workdir / e.path)
+    ]
+    for path in gone:
+        index.remove(path)
+    index.write()
+    tree = index.write_tree()
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    if parents and repo[parents[0]].tree_id == tree:
+        return False
+    sig = repo.default_signature
+    repo.create_commit("HEAD", sig, sig, GIT_COMMIT_MSG, tree, parents)
+    return True
 
 def git_commit_push(repo_root: Path, do_commit: bool, do_push: bool) -> Tuple[bool, bool]:
     """Stage vv/data + vv/manifests + vv/state/raw_index.json, commit, optionally push."""
@@ -157,24 +448,39 @@ def git_commit_push(repo_root: Path, do_commit: bool, do_push: bool) -> Tuple[bo
     if not do_commit and not do_push:
         return (False, False)
 
-    # git add (best-effort)
-    try:
-        subprocess.run(
-            ["git", "-C", str(repo_root), "add", "vv/data", "vv/manifests", "vv/state/raw_index.json"],
-            check=True, capture_output=True
-        )
-    except subprocess.CalledProcessError:
-        pass
-
-    if do_commit:
-        res = subprocess.run(
-            ["git", "-C", str(repo_root), "commit", "-m", "Parsed updates from raw"],
-            capture_output=True, text=True
-        )
-        if res.returncode == 0:
-            committed = True
+    # In-process commit when pygit2 is available; falls back to the git CLI
+    # (commit hooks or signing configured, no user.name/user.email for libgit2,
+    # or an unusual repo layout).
+    done = False
+    if do_commit and pygit2 is not None:
+        try:
+            result = _git_commit_pygit2(repo_root)
+            if result is not None:
+                committed = result
+                done = True
+        except (pygit2.GitError, KeyError, ValueError):
+            pass
+
+    if not done:
+        # git add (best-effort)
+        try:
+            subprocess.run(
+                ["git", "-C", str(repo_root), "add", *GIT_PATHS],
+                check=True, capture_output=True
+            )
+        except subprocess.CalledProcessError:
+            pass
+
+        if do_commit:
+            res = subprocess.run(
+                ["git", "-C", str(repo_root), "commit", "-m", GIT_COMMIT_MSG],
+                capture_output=True, text=True
+            )
+            if res.returncode == 0:
+                committed = True
 
     if do_push:
+        # Push stays on the CLI so the user's credential helpers/SSH agent apply.
         res = subprocess.run(["git", "-C", str(repo_root), "push"], capture_output=True, text=True)
         pushed = (res.returncode == 0)
 
@@ -188,6 +494,11 @@ def main():
     ap.add_argument("--dry-run", action="store_true", help="Parse & report; do not write files")
     ap.add_argument("--push", action="store_true", help="Force git push after commit (overrides config)")
     ap.add_argument("--force-all", action="store_true", help="Reprocess ALL raw files (ignore state)")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                    help="Worker processes for hashing/parsing (default: CPU count; 1 = serial)")
+    ap.add_argument("--cryptographic-hash", action="store_true",
+                    help="Use SHA256 for change detection even if xxhash is installed")
+    ap.add_argument("--paranoid", action="store_true", help="Always re-hash raw files (skip the mtime+size shortcut)")
     args = ap.parse_args()
 
     # Determine repo root from this script location (robust if run from anywhere)
@@ -213,6 +524,9 @@ def main():
     manifests_dir = DATA_DIR / "vv" / "manifests"
     state_path = STATE_PATH
 
+    # String prefix for the per-file loop; Path objects only at the I/O boundary
+    DATA_DIR_STR = os.fspath(data_dir) + os.sep
+
     # Prep
     if not RAW_DIR.exists():
         raise SystemExit(f"RAW_DIR not found: {RAW_DIR}")
@@ -220,118 +534,158 @@ def main():
     manifests_dir.mkdir(parents=True, exist_ok=True)
 
     ensure_headers(HEADERS_PATH, WRITE_HEADERS)
-    parser_mod = load_parser(PARSER)
-
-    # Discover candidate raw files
-    candidates: List[Tuple[Optional[int], Path]] = []
-    for p in sorted(RAW_DIR.glob("*")):
-        if p.is_file() and VERSE_RE.search(p.name):
-            m = VERSE_RE.search(p.name) # e.g. ('verse', '1') or ('name', '52')
-            n = None
-            if m:
-                # group 2 is the number
-                num_str = m.group(2)
-                n = int(num_str) if num_str else None
-            candidates.append((n, p))
+
+    # Discover candidate raw files: one scandir pass collects names + stat,
+    # then the name filter runs over that list.
+    entries = sorted(
+        ((e.name, e.path, e.stat()) for e in os.scandir(RAW_DIR) if e.is_file()),
+        key=lambda t: t[0],
+    )
+    candidates: List[Tuple[Optional[int], str, str, os.stat_result]] = []  # (n, rel, path, stat)
+    for name, path, st in entries:
+        m = VERSE_RE.search(name) # e.g. ('verse', '1') or ('name', '52')
+        if m:
+            # group 2 is the number
+            num_str = m.group(2)
+            n = int(num_str) if num_str else None
+            candidates.append((n, name, path, st))
     if not candidates:
         print(f"No verse files found in {RAW_DIR}")
         return
 
     state = load_state(state_path)
+    files = state["files"]
+    # One cache per state file, so configs sharing vv/state/ don't evict each other
+    stat_cache_path = state_path.with_name("." + state_path.stem + ".stat_cache.json")
+    stat_cache = load_stat_cache(stat_cache_path)
+
+    # Delta detection by content hash (or force-all). The state field is named
+    # after the algorithm, so entries written with the other one count as stale
+    # (and are reprocessed once) after switching.
+    if xxhash is not None and not args.cryptographic_hash:
+        hash_field, hash_file = "xxh3", xxh3_file
+    else:
+        hash_field, hash_file = "sha256", sha256_file
 
-    # Delta detection by SHA256 (or force-all)
+    # Stale set first: only files whose (mtime_ns, size) differ from the local
+    # stat cache, or whose cached digest no longer matches state, are hashed (all
+    # of them with --paranoid); the rest keep the stored digest without being
+    # reopened. Hashing is fanned out across processes.
     changed: List[Tuple[Optional[int], Path, str, str]] = []
-    for n, src in candidates:
-        rel = str(src.relative_to(RAW_DIR))
-        if args.force_all:
-            changed.append((n, src, rel, "FORCED"))
-            continue
-        digest = sha256_file(src)
-        prev = state["files"].get(rel, {}).get("sha256")
-        if prev != digest:
-            changed.append((n, src, rel, digest))
+    if args.force_all:
+        # Everything is reprocessed, but still hashed so state keeps real digests.
+        stale = candidates
+    else:
+        def is_stale(rel: str, st: os.stat_result) -> bool:
+            digest = files.get(rel, {}).get(hash_field)
+            cached = stat_cache.get(rel, {})
+            return (args.paranoid or not digest or cached.get(hash_field) != digest
+                    or cached.get("mtime_ns") != st.st_mtime_ns or cached.get("size") != st.st_size)
+        stale = [c for c in candidates if is_stale(c[1], c[3])]
+
+    digests = pool_map(hash_file, [Path(path) for _, _, path, _ in stale], args.jobs)
+    for (n, rel, path, st), digest in zip(stale, digests):
+        stat_cache[rel] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, hash_field: digest}
+        if args.force_all or files.get(rel, {}).get(hash_field) != digest:
+            changed.append((n, Path(path), rel, digest))
 
     if not changed:
+        # Touched-but-identical files only refresh the local cache, never the state file
+        if stale and not args.dry_run:
+            atomic_write_bytes(stat_cache_path, dump_json(stat_cache))
         print("No changes detected. Nothing to do.")
         return
     else:
         print(f"{len(changed)} file(s) to process: {[rel for _,_,rel,_ in changed]}")
 
-    # Process changed items
-    total_written = 0
+    # Parse changed items in parallel; all writes stay in this process
+    todo: List[Tuple[int, Path, str, str]] = []
     for n, src, rel, digest in changed:
-        verse_num = n if n is not None else None
-        if verse_num is None:
+        if n is None:
             print(f"Skip unnumbered file: {rel}")
             continue
-
+        todo.append((n, src, rel, digest))
+    # The parser is loaded only when there is something to parse, but always in
+    # this process first: a bad adapter fails here with a clear SystemExit rather
+    # than as a BrokenProcessPool from a worker initializer. Workers load their own copy.
+    srcs = [src for _, src, _, _ in todo]
+    parsed: List[Dict[str, Any]] = []
+    if srcs:
+        parser_mod = load_parser(PARSER)
+        if args.jobs > 1 and len(srcs) > 1:
+            parsed = pool_map(_parse_in_worker, srcs, args.jobs,
+                              initializer=_init_parser_worker, initargs=(PARSER,))
+        else:
+            parsed = [parser_mod.parse_file(src) for src in srcs]
+
+    # One timestamp for the whole run (verse last_modified + manifest last_updated)
+    now_iso = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    # Process changed items. Outputs whose content is unchanged (e.g. --force-all
+    # after a no-op parser change) are not rewritten and keep their last_modified.
+    total_written = 0
+    unchanged = 0
+    written: List[Tuple[str, str, int, Dict[str, Any]]] = []  # (out_name, type, num, content)
+    for (verse_num, src, rel, digest), verse_obj in zip(todo, parsed):
         # Determine output name based on raw file's prefix ("verse" or "name")
-        raw_match = VERSE_RE.search(src.name)
+        raw_match = VERSE_RE.search(rel)
         prefix = "verse" # default
         if raw_match:
             prefix = raw_match.group(1).lower()
         out_name = f"{prefix}-{verse_num:03d}.json"
-        out_file = data_dir / out_name
+        out_file = DATA_DIR_STR + out_name
         # Also define the path for the raw source copy
-        out_txt_file = out_file.with_suffix('.txt')
+        out_txt_file = out_file[:-len(".json")] + ".txt"
 
-        # Parse one raw file -> JSON
-        verse_obj = parser_mod.parse_file(src)
         validate_minimal(verse_obj, f"{prefix}-{verse_num:03d}")
 
         # Normalize metadata
         verse_obj.setdefault("id", f"{COLLECTION}/{verse_num:03d}")
         meta = verse_obj.setdefault("metadata", {})
         meta.setdefault("source", COLLECTION.split("/")[0])  # e.g., "mvr"
-        meta["last_modified"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
-
-        if not args.dry_run:
-            out_file.write_text(json.dumps(verse_obj, ensure_ascii=False, indent=2), encoding="utf-8")
-            # Save a copy of the raw source file
-            out_txt_file.write_text(src.read_text(encoding="utf-8"), encoding="utf-8")
-
-        total_written += 1
-        state["files"][rel] = {"sha256": digest, "verse": verse_num, "target": out_name}
-
-    # Rebuild index & manifest from actual data_dir (only if we wrote changes)
+        prev_stamp = unchanged_stamp(out_file, verse_obj)
+        meta["last_modified"] = prev_stamp or now_iso
+
+        # Copy of the raw source file
+        with open(src, encoding="utf-8") as f_in:
+            raw_copy = f_in.read().encode("utf-8")
+        txt_same = same_bytes(out_txt_file, raw_copy)
+
+        if prev_stamp is not None and txt_same:
+            unchanged += 1
+        else:
+            if not args.dry_run:
+                if prev_stamp is None:
+                    atomic_write_bytes(out_file, dump_json(verse_obj))
+                if not txt_same:
+                    atomic_write_bytes(out_txt_file, raw_copy)
+            total_written += 1
+        written.append((out_name, prefix, verse_num, verse_obj))
+        state["files"][rel] = {hash_field: digest, "verse": verse_num, "target": out_name}
+
+    # Update index & manifest (only if we wrote changes). The previous index is
+    # patched with this run's items; fall back to a full data_dir scan with
+    # --force-all or when the index is missing, corrupt, or was edited by hand.
     if not args.dry_run:
-        all_items = []
-        unified_search_index = []
-        search_index_items = []
-        # Look for both verse-*.json and name-*.json
-        for jp in sorted(data_dir.glob("*-*.json")):
-            m = VERSE_RE.search(jp.name)
-            if m:
-                item_type = m.group(1).lower() # "verse", "name", or "epilogue"
-                item_num = int(m.group(2))
-                item = {"file": jp.name, "type": item_type, "id": item_num}
-                # For backwards compatibility with the UI, ensure 'verse' or 'nama' key exists.
-                if item_type == "verse":
-                    item["verse"] = item_num
-                elif item_type == "name":
-                    item["nama"] = item_num
-                elif item_type == "epilogue":
-                    item["epilogue"] = item_num
-                all_items.append(item)
-
-                # Add to unified search index
-                content = json.loads(jp.read_text(encoding="utf-8"))
-                search_text = content.get("sa", "").split('\n')[0] # First line of Sanskrit
-                full_content = ' '.join(str(v) for v in content.values() if isinstance(v, str))
-                unified_search_index.append({
-                    "id": item_num,
-                    "type": item_type,
-                    "text": search_text,
-                    "content": full_content
-                })
-
-                # Legacy: If it's a name, add its content to the old search index
-                if item_type == "name":
-                    if "sa" in content:
-                        search_item = {"id": item_num, "sa": content["sa"]}
-                        if "words" in content: # Check for the new 'words' key
-                            search_item["words"] = content["words"]
-                        search_index_items.append(search_item)
+        index_path = data_dir / INDEX_NAME
+        search_path = data_dir / SEARCH_INDEX_NAME
+        output_names = list_output_names(data_dir)
+        entries = None
+        if not args.force_all:
+            entries = load_index_entries(index_path, search_path, state.get("index_sha256"))
+        if entries is not None:
+            for name, item_type, item_num, content in written:
+                entries[name] = (index_item(name, item_type, item_num), search_entry(item_type, item_num, content))
+            # The previous index only knows what earlier runs wrote: drop files that
+            # were deleted since, and rescan if files appeared that it never saw.
+            entries = {name: entry for name, entry in entries.items() if name in output_names}
+            if len(entries) != len(output_names):
+                entries = None
+        if entries is None:
+            entries = scan_index_entries(data_dir, output_names)
+
+        all_items = [item for item, _ in entries.values()]
+        unified_search_index = [entries[name][1] for name in sorted(entries)]
 
         # Sort by type ('verse' before 'name' before 'epilogue') and then by id
         type_order = {"verse": 0, "name": 1, "epilogue": 2}
@@ -356,15 +710,25 @@ def main():
             "base": f"/{BASE}",
             "total": len(all_items),
             "schema_version": "2.0", # Bump version to reflect new structure
-            "last_updated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "last_updated": now_iso,
         }
 
-        # Write index, manifest, state
-        (data_dir / INDEX_NAME).write_text(json.dumps(index_obj, ensure_ascii=False, indent=2), encoding="utf-8")
-        (manifests_dir / MANIFEST_NAME).write_text(json.dumps(manifest_obj, ensure_ascii=False, indent=2), encoding="utf-8")
+        # Write index, manifest, state (index files and manifest only if they changed)
+        index_bytes = dump_json(index_obj)
+        search_bytes = dump_json(unified_search_index)
+        state["index_sha256"] = index_digest(index_bytes, search_bytes)
+        index_changed = False
+        if not same_bytes(index_path, index_bytes):
+            atomic_write_bytes(index_path, index_bytes)
+            index_changed = True
+        manifest_path = manifests_dir / MANIFEST_NAME
+        if total_written or index_changed or not same_bytes(search_path, search_bytes) or not manifest_path.exists():
+            atomic_write_bytes(manifest_path, dump_json(manifest_obj))
         save_state(state_path, state)
+        atomic_write_bytes(stat_cache_path, dump_json(stat_cache))
         # Write new unified search index, replacing the old one
-        (data_dir / "search-index.json").write_text(json.dumps(unified_search_index, ensure_ascii=False, indent=2), encoding="utf-8")
+        if not same_bytes(search_path, search_bytes):
+            atomic_write_bytes(search_path, search_bytes)
 
         committed, pushed = git_commit_push(repo_root, GIT_AUTOCOMMIT, GIT_AUTOPUSH)
         if committed:
@@ -373,6 +737,8 @@ def main():
             print("Pushed changes." if pushed else "Push failed or nothing to push.")
 
     print(f"Wrote {total_written} updated verse(s).")
+    if unchanged:
+        print(f"Skipped {unchanged} verse(s) with unchanged output.")
     print(f"Data dir: {data_dir}")
     print(f"Manifest: {manifests_dir / MANIFEST_NAME}")
     print(f"State:    {state_path}")